@@ -245,6 +245,8 @@ class ConfigManager:
         """
         return {
             "version": 1,
+            # レポート系のモジュールロガーを設定適用時に無効化しない
+            "disable_existing_loggers": False,
             "formatters": {"detailed": {"format": self.logging_config["log_format"]}},
             "handlers": {
                 "console": {
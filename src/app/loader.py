@@ -1,9 +1,111 @@
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
 
 from ..outputs.csv import CSVOutput
 
+# 配当・利子の履歴CSVの列（両者で共通）
+_INCOME_FIELDS = (
+    "date",
+    "account",
+    "symbol",
+    "description",
+    "action",
+    "gross_amount",
+    "tax_amount",
+    "net_amount",
+    "gross_amount_jpy",
+    "tax_amount_jpy",
+    "net_amount_jpy",
+    "exchange_rate",
+)
+
+# ライター名 → (出力パスのキー, CSV列名)
+_WRITER_SPECS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "dividend_csv": ("dividend_history", _INCOME_FIELDS),
+    "interest_csv": ("interest_history", _INCOME_FIELDS),
+    "stock_trade_csv": (
+        "stock_trade_history",
+        (
+            "date",
+            "account",
+            "symbol",
+            "description",
+            "action",
+            "quantity",
+            "price",
+            "realized_gain",
+            "price_jpy",
+            "realized_gain_jpy",
+            "exchange_rate",
+        ),
+    ),
+    "option_trade_csv": (
+        "option_trade_history",
+        (
+            "date",
+            "account",
+            "symbol",
+            "description",
+            "action",
+            "quantity",
+            "option_type",
+            "strike_price",
+            "expiry_date",
+            "underlying",
+            "price",
+            "fees",
+            "trading_pnl",
+            "premium_pnl",
+            "price_jpy",
+            "fees_jpy",
+            "trading_pnl_jpy",
+            "premium_pnl_jpy",
+            "exchange_rate",
+            "position_type",
+            "is_closed",
+            "is_expired",
+            "is_assigned",
+        ),
+    ),
+    "option_summary_csv": (
+        "option_summary",
+        (
+            "account",
+            "symbol",
+            "description",
+            "underlying",
+            "option_type",
+            "strike_price",
+            "expiry_date",
+            "open_date",
+            "close_date",
+            "status",
+            "initial_quantity",
+            "remaining_quantity",
+            "trading_pnl",
+            "premium_pnl",
+            "total_fees",
+            "trading_pnl_jpy",
+            "premium_pnl_jpy",
+            "total_fees_jpy",
+            "exchange_rate",
+        ),
+    ),
+    "final_summary_csv": (
+        "final_summary",
+        (
+            "category",
+            "subcategory",
+            "gross_amount_usd",
+            "tax_amount_usd",
+            "net_amount_usd",
+            "gross_amount_jpy",
+            "tax_amount_jpy",
+            "net_amount_jpy",
+        ),
+    ),
+}
+
 
 class ComponentLoader:
     """
@@ -36,20 +138,8 @@ class ComponentLoader:
             paths = self.config.get_output_paths()
 
             writers = {
-                "dividend_csv": self._create_dividend_writer(paths["dividend_history"]),
-                "interest_csv": self._create_interest_writer(paths["interest_history"]),
-                "stock_trade_csv": self._create_stock_writer(
-                    paths["stock_trade_history"]
-                ),
-                "option_trade_csv": self._create_option_writer(
-                    paths["option_trade_history"]
-                ),
-                "option_summary_csv": self._create_option_summary_writer(
-                    paths["option_summary"]
-                ),
-                "final_summary_csv": self._create_summary_writer(
-                    paths["final_summary"]
-                ),
+                name: CSVOutput(paths[path_key], fieldnames)
+                for name, (path_key, fieldnames) in _WRITER_SPECS.items()
             }
 
             self.logger.info(f"{len(writers)}個のCSVライターを作成しました")
@@ -58,136 +148,3 @@ class ComponentLoader:
         except Exception as e:
             self.logger.error(f"CSVライター作成中にエラー: {e}")
             raise
-
-    def _create_dividend_writer(self, path: Path) -> CSVOutput:
-        """配当データ用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "date",
-                "account",
-                "symbol",
-                "description",
-                "action",
-                "gross_amount",
-                "tax_amount",
-                "net_amount",
-                "gross_amount_jpy",
-                "tax_amount_jpy",
-                "net_amount_jpy",
-                "exchange_rate",
-            ],
-        )
-
-    def _create_interest_writer(self, path: Path) -> CSVOutput:
-        """利子データ用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "date",
-                "account",
-                "symbol",
-                "description",
-                "action",
-                "gross_amount",
-                "tax_amount",
-                "net_amount",
-                "gross_amount_jpy",
-                "tax_amount_jpy",
-                "net_amount_jpy",
-                "exchange_rate",
-            ],
-        )
-
-    def _create_stock_writer(self, path: Path) -> CSVOutput:
-        """株式取引データ用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "date",
-                "account",
-                "symbol",
-                "description",
-                "action",
-                "quantity",
-                "price",
-                "realized_gain",
-                "price_jpy",
-                "realized_gain_jpy",
-                "exchange_rate",
-            ],
-        )
-
-    def _create_option_writer(self, path: Path) -> CSVOutput:
-        """オプション取引データ用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "date",
-                "account",
-                "symbol",
-                "description",
-                "action",
-                "quantity",
-                "option_type",
-                "strike_price",
-                "expiry_date",
-                "underlying",
-                "price",
-                "fees",
-                "trading_pnl",
-                "premium_pnl",
-                "price_jpy",
-                "fees_jpy",
-                "trading_pnl_jpy",
-                "premium_pnl_jpy",
-                "exchange_rate",
-                "position_type",
-                "is_closed",
-                "is_expired",
-                "is_assigned",
-            ],
-        )
-
-    def _create_option_summary_writer(self, path: Path) -> CSVOutput:
-        """オプション取引サマリー用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "account",
-                "symbol",
-                "description",
-                "underlying",
-                "option_type",
-                "strike_price",
-                "expiry_date",
-                "open_date",
-                "close_date",
-                "status",
-                "initial_quantity",
-                "remaining_quantity",
-                "trading_pnl",
-                "premium_pnl",
-                "total_fees",
-                "trading_pnl_jpy",
-                "premium_pnl_jpy",
-                "total_fees_jpy",
-                "exchange_rate",
-            ],
-        )
-
-    def _create_summary_writer(self, path: Path) -> CSVOutput:
-        """最終サマリー用のCSVライターを作成"""
-        return CSVOutput(
-            path,
-            [
-                "category",
-                "subcategory",
-                "gross_amount_usd",
-                "tax_amount_usd",
-                "net_amount_usd",
-                "gross_amount_jpy",
-                "tax_amount_jpy",
-                "net_amount_jpy",
-            ],
-        )
@@ -8,11 +8,14 @@ from ..report.stock import StockTradeReportGenerator
 from ..report.option import OptionTradeReportGenerator
 from ..report.summary import FinalSummaryReportGenerator, OptionSummaryReportGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class InvestmentReporter:
     def __init__(self, writers):
         self.writers = writers
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # 計算クラスは状態を持たないため、レポート生成ごとに作り直さず共有する
+        self._calculator = ReportCalculator()
         self._initialize_generators()
 
     def _initialize_generators(self):
@@ -42,11 +45,13 @@ class InvestmentReporter:
             生成成功の場合True
         """
         try:
-            self._generate_detail_reports(data)
-            self._output_console_summary(data)
+            # 集計値は最終サマリーCSVとコンソール出力で共有するため一度だけ計算
+            report_data = self._prepare_summaries(data)
+            self._generate_detail_reports(report_data)
+            self._output_console_summary(report_data)
             return True
         except Exception as e:
-            self.logger.error(f"レポート生成エラー: {e}")
+            logger.error(f"レポート生成エラー: {e}")
             return False
 
     def _generate_detail_reports(self, data: Dict[str, Any]):
@@ -55,11 +60,15 @@ class InvestmentReporter:
             try:
                 generator.generate_and_write(data)
             except Exception as e:
-                self.logger.error(f"{name}レポート生成エラー: {e}")
+                logger.error(f"{name}レポート生成エラー: {e}")
 
     def _output_console_summary(self, data: Dict[str, Any]):
         """コンソール用サマリーの出力"""
-        income_summary = self._calculate_income_summary(data)
+        # 事前計算に失敗していた場合は、ここで改めて集計する
+        if "income_summary" not in data:
+            data = {**data, **self._calculate_summaries(data)}
+
+        income_summary = data["income_summary"]
         trading_summary = self._calculate_trading_summary(data)
         total_summary = self._calculate_total_summary(income_summary, trading_summary)
 
@@ -71,22 +80,62 @@ class InvestmentReporter:
 
         self.writers["console"].output(summary)
 
-    def _calculate_income_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """収入サマリーの計算"""
-        calculator = ReportCalculator()
-        return calculator.calculate_income_summary(
-            data.get("dividend_records", []), data.get("interest_records", [])
+    def _prepare_summaries(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        各出力で共有する集計値を事前計算
+
+        集計に失敗した場合はエラーを記録して元のデータを返します。
+        その場合も各詳細レポートは書き出され、最終サマリーは自身で集計します。
+
+        Args:
+            data: レポート生成用データ
+
+        Returns:
+            集計値（income_summary, stock_summary, option_pnl_totals）を加えたデータ
+        """
+        try:
+            return {**data, **self._calculate_summaries(data)}
+        except Exception as e:
+            logger.error(f"サマリー集計エラー: {e}")
+            return data
+
+    def _calculate_summaries(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        収入・株式・オプションの集計値を計算
+
+        Args:
+            data: レポート生成用データ
+
+        Returns:
+            income_summary, stock_summary, option_pnl_totalsの辞書
+        """
+        calculator = self._calculator
+
+        # オプション損益はプロセッサが集計済みの合計を、レコードと一致する場合のみ利用
+        option_records = data.get("option_records", [])
+        option_processor = data.get("option_processor")
+        option_pnl_totals = (
+            option_processor.get_pnl_totals(option_records)
+            if option_processor
+            else None
         )
+        if option_pnl_totals is None:
+            option_pnl_totals = calculator.calculate_option_summary_details(option_records)
+
+        return {
+            "income_summary": calculator.calculate_income_summary(
+                data.get("dividend_records", []), data.get("interest_records", [])
+            ),
+            "stock_summary": calculator.calculate_stock_summary_details(
+                data.get("stock_records", [])
+            ),
+            "option_pnl_totals": option_pnl_totals,
+        }
 
     def _calculate_trading_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """取引サマリーの計算"""
-        calculator = ReportCalculator()
-        stock_summary = calculator.calculate_stock_summary_details(
-            data.get("stock_records", [])
-        )
-        option_summary = calculator.calculate_option_summary_details(
-            data.get("option_records", [])
-        )
+        stock_summary = data["stock_summary"]
+        option_summary = data["option_pnl_totals"]
 
         return {
             "stock_gain": stock_summary,
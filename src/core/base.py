@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Any, Optional, Dict
+from typing import Generic, TypeVar, List, Any, Optional, Dict, ClassVar
 from datetime import date
 import logging
 
@@ -16,9 +16,17 @@ class BaseHandler(ABC):
     共通のインターフェースを定義します。
     """
 
+    # クラスごとのロガー（サブクラス定義時に一度だけ取得する）
+    _logger: ClassVar[logging.Logger] = logging.getLogger("BaseHandler")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """サブクラスごとのロガーを設定"""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+
     def __init__(self) -> None:
         """ハンドラーを初期化"""
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = self._logger
 
     @abstractmethod
     def handle(self, data: Any) -> Any:
@@ -163,9 +171,17 @@ class BaseProcessor(Generic[T, R]):
     共通の処理機能を提供します。
     """
 
+    # クラスごとのロガー（インスタンス生成のたびにgetLoggerを呼ばない）
+    _logger: ClassVar[logging.Logger] = logging.getLogger("BaseProcessor")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """サブクラスごとのロガーを設定"""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+
     def __init__(self) -> None:
         """プロセッサを初期化"""
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = self._logger
         self._initialize()
 
     def _initialize(self) -> None:
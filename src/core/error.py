@@ -11,6 +11,8 @@ class InvestmentError(Exception):
     エラーの詳細情報を構造化された形で保持します。
     """
 
+    __slots__ = ("details",)
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None) -> None:
         """
         例外を初期化
@@ -31,7 +33,7 @@ class DataError(InvestmentError):
     全ての例外の基底クラスとして機能します。
     """
 
-    pass
+    __slots__ = ()
 
 
 class LoaderError(DataError):
@@ -42,6 +44,8 @@ class LoaderError(DataError):
     関するエラーを表現します。
     """
 
+    __slots__ = ("source",)
+
     def __init__(
         self, message: str, source: str, details: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -65,6 +69,8 @@ class ParseError(DataError):
     表現します。
     """
 
+    __slots__ = ("raw_value", "target_type")
+
     def __init__(
         self,
         message: str,
@@ -94,7 +100,7 @@ class ValidationError(DataError):
     エラーを表現します。
     """
 
-    pass
+    __slots__ = ()
 
 
 class TransactionError(InvestmentError):
@@ -105,6 +111,8 @@ class TransactionError(InvestmentError):
     表現します。
     """
 
+    __slots__ = ("transaction_date", "symbol", "amount")
+
     def __init__(
         self,
         message: str,
@@ -137,6 +145,8 @@ class PositionError(InvestmentError):
     表現します。
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(
         self, message: str, symbol: str, details: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -160,7 +170,7 @@ class ConfigurationError(InvestmentError):
     表現します。
     """
 
-    pass
+    __slots__ = ()
 
 
 class ExchangeRateError(InvestmentError):
@@ -171,6 +181,8 @@ class ExchangeRateError(InvestmentError):
     表現します。
     """
 
+    __slots__ = ("base_currency", "target_currency", "rate_date")
+
     def __init__(
         self,
         message: str,
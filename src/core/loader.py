@@ -3,7 +3,12 @@ from typing import List, Optional, Dict, Any, TypeVar
 from pathlib import Path
 import json
 import logging
-from datetime import datetime
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonで解析する
+    orjson = None
 
 from .error import LoaderError
 from .tx import Transaction
@@ -40,29 +45,6 @@ class BaseLoader(ABC):
         """
         pass
 
-    def _validate_source(self, source: Path) -> None:
-        """
-        データソースを検証
-
-        Args:
-            source: 検証するパス
-
-        Raises:
-            LoaderError: ソースが無効な場合
-        """
-        if not source.exists():
-            raise LoaderError(
-                f"ソースファイルが存在しません: {source}",
-                str(source),
-                {"type": "file_not_found"},
-            )
-        if not source.is_file():
-            raise LoaderError(
-                f"指定されたパスはファイルではありません: {source}",
-                str(source),
-                {"type": "invalid_source_type"},
-            )
-
 
 class JSONLoader(BaseLoader):
     """
@@ -95,11 +77,30 @@ class JSONLoader(BaseLoader):
         Raises:
             LoaderError: ファイル読み込みまたは解析エラー
         """
+        self.logger.debug(f"JSONファイルの読み込みを開始: {source}")
+        # 存在確認とファイル種別の確認は事前のstatではなくopenの失敗で判定する
         try:
-            self._validate_source(source)
-            self.logger.debug(f"JSONファイルの読み込みを開始: {source}")
+            file = source.open("rb")
+        except FileNotFoundError:
+            raise LoaderError(
+                f"ソースファイルが存在しません: {source}",
+                str(source),
+                {"type": "file_not_found"},
+            )
+        except IsADirectoryError:
+            raise LoaderError(
+                f"指定されたパスはファイルではありません: {source}",
+                str(source),
+                {"type": "invalid_source_type"},
+            )
+        except OSError as e:
+            self.logger.error(f"ファイル読み込み中にエラー: {e}")
+            raise LoaderError(
+                f"ファイルの読み込みに失敗: {source}", str(source), {"error": str(e)}
+            )
 
-            with source.open("r", encoding="utf-8") as f:
+        try:
+            with file as f:
                 data = self._load_json(f)
 
             transactions = self._process_transactions(data, source.stem)
@@ -126,8 +127,12 @@ class JSONLoader(BaseLoader):
         """
         JSONファイルを読み込んで解析
 
+        orjsonが利用可能な場合はそちらで解析します。
+        orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラスのため、
+        呼び出し側のエラー処理は共通です。
+
         Args:
-            file: オープンされたファイルオブジェクト
+            file: バイナリモードでオープンされたファイルオブジェクト
 
         Returns:
             解析されたJSONデータ
@@ -136,6 +141,8 @@ class JSONLoader(BaseLoader):
             json.JSONDecodeError: JSON解析エラー
         """
         try:
+            if orjson is not None:
+                return orjson.loads(file.read())
             return json.load(file)
         except json.JSONDecodeError as e:
             self.logger.error(f"JSONの解析に失敗: {e}")
@@ -160,12 +167,16 @@ class JSONLoader(BaseLoader):
 
         self.logger.debug(f"トランザクション処理: {from_date} から {to_date}")
 
+        # 範囲は日付単位のため、比較用のdateへの変換はファイルごとに一度だけ行う
+        from_day = from_date.date() if from_date else None
+        to_day = to_date.date() if to_date else None
+
         for record in data.get("BrokerageTransactions", []):
             try:
                 record["account_id"] = account_id
                 transaction = self.parser.parse_transaction(record)
 
-                if self._validate_transaction_date(transaction, from_date, to_date):
+                if self._validate_transaction_date(transaction, from_day, to_day):
                     transactions.append(transaction)
 
             except Exception as e:
@@ -198,8 +209,8 @@ class JSONLoader(BaseLoader):
     def _validate_transaction_date(
         self,
         transaction: Transaction,
-        from_date: Optional[datetime],
-        to_date: Optional[datetime],
+        from_date: Optional[date],
+        to_date: Optional[date],
     ) -> bool:
         """
         トランザクション日付が指定された範囲内かを検証
@@ -215,7 +226,4 @@ class JSONLoader(BaseLoader):
         if not from_date or not to_date:
             return True
 
-        transaction_date = datetime.combine(
-            transaction.transaction_date, datetime.min.time()
-        )
-        return from_date <= transaction_date <= to_date
+        return from_date <= transaction.transaction_date <= to_date
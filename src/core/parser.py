@@ -1,14 +1,72 @@
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Any, Dict, Type, TypeVar, List
+from typing import Optional, Any, Dict, Type, TypeVar, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
 import logging
+import sys
 from dataclasses import dataclass, field
 
+from ..exchange.money import ZERO
 from .error import ParseError
 from .tx import Transaction
 
 T = TypeVar("T")
 
+# トランザクションの生成に使うJSONレコードのキー（並び順はparse_transactionの展開順）
+_TRANSACTION_KEYS: Tuple[str, ...] = (
+    "Date",
+    "account_id",
+    "Symbol",
+    "Description",
+    "Amount",
+    "Action",
+    "Quantity",
+    "Price",
+    "Fees & Comm",
+)
+_get_transaction_fields = itemgetter(*_TRANSACTION_KEYS)
+
+
+@lru_cache(maxsize=65536)
+def _to_decimal(value: str) -> Decimal:
+    """
+    クリーニング済みの数値文字列をDecimalに変換
+
+    "0.00"や手数料の"0"のように同じ文字列が繰り返し現れるため、
+    変換結果をキャッシュして同一のインスタンスを返します。
+
+    Args:
+        value: 変換する数値文字列
+
+    Returns:
+        変換されたDecimal
+
+    Raises:
+        InvalidOperation: 数値として解釈できない場合
+    """
+    return Decimal(value)
+
+
+def _is_slash_mdy(value: str) -> bool:
+    """
+    MM/DD/YYYY形式（ゼロ埋め）の日付文字列かを判定
+
+    Args:
+        value: 判定する文字列
+
+    Returns:
+        形式が一致する場合True
+    """
+    return (
+        len(value) == 10
+        and value[2] == "/"
+        and value[5] == "/"
+        and value[:2].isdigit()
+        and value[3:5].isdigit()
+        and value[6:].isdigit()
+    )
+
 
 @dataclass
 class ParserConfig:
@@ -107,6 +165,19 @@ class TransactionParser(BaseParser):
     日付、金額、数量などの各フィールドの適切なパースを担当します。
     """
 
+    def __init__(self, config: Optional[ParserConfig] = None) -> None:
+        """
+        パーサーを初期化
+
+        Args:
+            config: パーサーの設定（オプション）
+        """
+        super().__init__(config)
+        # 同じ取引日の行は多数あるため、日付文字列ごとにパース結果を保持する
+        self._date_cache: Dict[str, date] = {}
+        formats = self.config.date_formats
+        self._slash_mdy_first = bool(formats) and formats[0] == "%m/%d/%Y"
+
     def parse_date(self, date_str: str) -> date:
         """
         日付文字列をパース
@@ -123,14 +194,34 @@ class TransactionParser(BaseParser):
         if not date_str:
             raise ParseError("日付が空です", date_str, "date")
 
+        cached = self._date_cache.get(date_str)
+        if cached is not None:
+            return cached
+
         # 'as of' の処理
         clean_date_str = date_str.split(" as of ")[0].strip()
 
+        # 先頭の書式がMM/DD/YYYYの場合は、strptimeを使わず数値を切り出して変換する
+        if self._slash_mdy_first and _is_slash_mdy(clean_date_str):
+            try:
+                parsed = date(
+                    int(clean_date_str[6:]),
+                    int(clean_date_str[:2]),
+                    int(clean_date_str[3:5]),
+                )
+            except ValueError:
+                pass
+            else:
+                self._date_cache[date_str] = parsed
+                return parsed
+
         for fmt in self.config.date_formats:
             try:
-                return datetime.strptime(clean_date_str, fmt).date()
+                parsed = datetime.strptime(clean_date_str, fmt).date()
             except ValueError:
                 continue
+            self._date_cache[date_str] = parsed
+            return parsed
 
         raise ParseError(
             f"日付のパースに失敗: {date_str}",
@@ -154,7 +245,7 @@ class TransactionParser(BaseParser):
         """
         try:
             cleaned = self._clean_numeric(value)
-            return Decimal(cleaned) if cleaned else Decimal("0")
+            return _to_decimal(cleaned) if cleaned else ZERO
         except InvalidOperation as e:
             raise ParseError(
                 f"金額のパースに失敗: {value}", value, "decimal", {"error": str(e)}
@@ -175,7 +266,7 @@ class TransactionParser(BaseParser):
 
         try:
             cleaned = self._clean_numeric(value)
-            return Decimal(cleaned) if cleaned else None
+            return _to_decimal(cleaned) if cleaned else None
         except InvalidOperation as e:
             raise ParseError(
                 f"数量のパースに失敗: {value}", value, "decimal", {"error": str(e)}
@@ -196,7 +287,7 @@ class TransactionParser(BaseParser):
 
         try:
             cleaned = self._clean_numeric(value)
-            return Decimal(cleaned) if cleaned else None
+            return _to_decimal(cleaned) if cleaned else None
         except InvalidOperation as e:
             raise ParseError(
                 f"価格のパースに失敗: {value}", value, "decimal", {"error": str(e)}
@@ -217,7 +308,7 @@ class TransactionParser(BaseParser):
 
         try:
             cleaned = self._clean_numeric(value)
-            return Decimal(cleaned) if cleaned else None
+            return _to_decimal(cleaned) if cleaned else None
         except InvalidOperation as e:
             raise ParseError(
                 f"手数料のパースに失敗: {value}", value, "decimal", {"error": str(e)}
@@ -237,16 +328,36 @@ class TransactionParser(BaseParser):
             ParseError: パース失敗時
         """
         try:
+            # 全キーが揃った通常のレコードはC実装のitemgetterで一括取得し、
+            # 欠けたキーがある場合のみ空文字を補って取得する
+            try:
+                fields = _get_transaction_fields(data)
+            except KeyError:
+                fields = tuple(data.get(key, "") for key in _TRANSACTION_KEYS)
+            (
+                date_str,
+                account_id,
+                symbol,
+                description,
+                amount,
+                action,
+                quantity,
+                price,
+                fees,
+            ) = fields
+
             return Transaction(
-                transaction_date=self.parse_date(data.get("Date", "")),
-                account_id=str(data.get("account_id", "")),
-                symbol=str(data.get("Symbol", "")),
-                description=str(data.get("Description", "")),
-                amount=self.parse_amount(data.get("Amount", "")),
-                action_type=str(data.get("Action", "")),
-                quantity=self.parse_quantity(data.get("Quantity", "")),
-                price=self.parse_price(data.get("Price", "")),
-                fees=self.parse_fees(data.get("Fees & Comm", "")),
+                transaction_date=self.parse_date(date_str),
+                # 口座・銘柄・アクションは値の種類が少なく、集計時のキーや
+                # 判定で繰り返し比較されるためインターンして共有する
+                account_id=sys.intern(str(account_id)),
+                symbol=sys.intern(str(symbol)),
+                description=str(description),
+                amount=self.parse_amount(amount),
+                action_type=sys.intern(str(action)),
+                quantity=self.parse_quantity(quantity),
+                price=self.parse_price(price),
+                fees=self.parse_fees(fees),
                 metadata={"raw_data": data},
             )
         except ParseError:
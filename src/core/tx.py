@@ -43,30 +43,42 @@ class TransactionType(Enum):
             >>> TransactionType.from_str("Dividend Payment")
             TransactionType.DIVIDEND
         """
-        action_upper = action.upper()
-
-        # 取引種別の判定マッピング
-        TYPE_MAPPING: Final[Dict[str, TransactionType]] = {
-            "BUY": cls.BUY,
-            "SELL": cls.SELL,
-            "DIVIDEND": cls.DIVIDEND,
-            "INTEREST": cls.INTEREST,
-            "TAX": cls.TAX,
-            "FEE": cls.FEE,
-            "COMMISSION": cls.FEE,
-            "JOURNAL": cls.JOURNAL,
-        }
+        cached = _TRANSACTION_TYPE_CACHE.get(action)
+        if cached is not None:
+            return cached
 
-        # 完全一致で判定
-        if action_upper in TYPE_MAPPING:
-            return TYPE_MAPPING[action_upper]
-
-        # 部分一致で判定
-        for key, value in TYPE_MAPPING.items():
-            if key in action_upper:
-                return value
+        action_upper = action.upper()
 
-        return cls.OTHER
+        # 完全一致で判定し、なければ部分一致で判定
+        transaction_type = _TRANSACTION_TYPE_KEYWORDS.get(action_upper)
+        if transaction_type is None:
+            transaction_type = next(
+                (
+                    value
+                    for key, value in _TRANSACTION_TYPE_KEYWORDS.items()
+                    if key in action_upper
+                ),
+                cls.OTHER,
+            )
+
+        _TRANSACTION_TYPE_CACHE[action] = transaction_type
+        return transaction_type
+
+
+# 取引種別の判定テーブル（キーワード → 取引種別、部分一致はこの順序で判定）
+_TRANSACTION_TYPE_KEYWORDS: Final[Dict[str, TransactionType]] = {
+    "BUY": TransactionType.BUY,
+    "SELL": TransactionType.SELL,
+    "DIVIDEND": TransactionType.DIVIDEND,
+    "INTEREST": TransactionType.INTEREST,
+    "TAX": TransactionType.TAX,
+    "FEE": TransactionType.FEE,
+    "COMMISSION": TransactionType.FEE,
+    "JOURNAL": TransactionType.JOURNAL,
+}
+
+# アクション文字列ごとの判定結果（アクションの種類は少ないため全件保持する）
+_TRANSACTION_TYPE_CACHE: Dict[str, TransactionType] = {}
 
 
 class TransactionValidator(ABC):
@@ -115,17 +127,19 @@ class BasicTransactionValidator(TransactionValidator):
         return True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     取引情報を表すイミュータブルなデータクラス
 
     全ての取引に関する基本情報を保持し、計算や変換のメソッドを提供します。
     frozenなデータクラスとして実装され、作成後の変更を防止します。
+    取引行ごとに生成されるため、__slots__でインスタンスの__dict__を持たせません。
     """
 
     # クラス変数
     ROUND_DIGITS: ClassVar[int] = 2
+    ROUND_QUANTUM: ClassVar[Decimal] = Decimal(1).scaleb(-ROUND_DIGITS)
     DEFAULT_CURRENCY: ClassVar[Currency] = Currency.USD
 
     # 基本情報
@@ -207,7 +221,7 @@ class Transaction:
         base = abs(self.amount)
         if self.fees:
             base += abs(self.fees)
-        return base.quantize(Decimal(f"0.{('0' * self.ROUND_DIGITS)}"))
+        return base.quantize(self.ROUND_QUANTUM)
 
     def create_money(
         self, currency: Currency = DEFAULT_CURRENCY, rate_date: Optional[date] = None
@@ -31,6 +31,10 @@ class Currency(Enum):
     CAD = CurrencyInfo("CAD", "C$", 2, "Canadian Dollar", "Canada")
     AUD = CurrencyInfo("AUD", "A$", 2, "Australian Dollar", "Australia")
 
+    # メンバーは単一インスタンスで同値判定も同一性によるため、ハッシュも同一性で求める
+    # （Enum既定の名前ハッシュはPython実装で、Moneyの通貨別辞書の参照ごとに呼ばれる）
+    __hash__ = object.__hash__
+
     def __init__(self, info: CurrencyInfo):
         """通貨情報の初期化"""
         object.__setattr__(self, "_info", info)
@@ -116,18 +120,11 @@ class Currency(Enum):
         # 大文字に変換して比較
         upper_value = value.upper().strip()
 
-        # コードで検索
-        try:
-            return cls(cls._member_map_[upper_value])
-        except KeyError:
-            pass
-
-        # シンボルで検索
-        for currency in cls:
-            if currency.symbol == value:
-                return currency
-
-        return default
+        # コードで検索し、なければシンボルで検索
+        currency = cls._member_map_.get(upper_value)
+        if currency is None:
+            currency = _CURRENCY_BY_SYMBOL.get(value)
+        return currency if currency is not None else default
 
     def __str__(self) -> str:
         """通貨コードを文字列として返す"""
@@ -146,3 +143,9 @@ class Currency(Enum):
             通貨コードをキーとする通貨の辞書
         """
         return {currency.code: currency for currency in cls}
+
+
+# 通貨シンボル → 通貨（from_strのシンボル検索用）
+_CURRENCY_BY_SYMBOL: Dict[str, Currency] = {
+    currency.symbol: currency for currency in Currency
+}
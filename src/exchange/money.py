@@ -1,12 +1,31 @@
 from dataclasses import dataclass, field
 from datetime import date
-from decimal import Decimal, InvalidOperation
-from typing import Dict, Optional, Union, overload
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import ClassVar, Dict, Optional, Union, overload
 import logging
 
 from .currency import Currency
 from .exchange import exchange
 
+# 金額のゼロ値（Decimalは不変のため、各モジュールはこれをインポートして共有する）
+ZERO = Decimal("0")
+
+# 金額の丸め単位（セント）
+_CENT = Decimal("0.01")
+
+
+def round_cent(value: Decimal) -> Decimal:
+    """
+    金額をセント単位に四捨五入
+
+    Args:
+        value: 丸める金額
+
+    Returns:
+        小数点以下2桁に四捨五入した金額
+    """
+    return value.quantize(_CENT, ROUND_HALF_UP)
+
 
 class CurrencyConversionError(Exception):
     """通貨変換に関するエラー"""
@@ -14,16 +33,18 @@ class CurrencyConversionError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money:
     """
     通貨金額を管理する不変クラス
 
     すべての金額関連の操作を一元管理し、安全な通貨計算を提供します。
     frozenなデータクラスとして実装され、作成後の変更を防止します。
+    集計のたびに大量に生成されるため、__slots__で__dict__を持たせません。
     """
 
-    _logger: logging.Logger = field(default_factory=lambda: logging.getLogger("Money"))
+    # ロガーは全インスタンスで共有する（インスタンスごとのフィールドにしない）
+    _logger: ClassVar[logging.Logger] = logging.getLogger("Money")
     currency: Currency = field(default=Currency.USD)
     rate_date: date = field(default_factory=date.today)
     _values: Dict[Currency, Decimal] = field(default_factory=dict)
@@ -95,7 +116,7 @@ class Money:
                         self._logger.warning(
                             f"通貨変換失敗: {currency} -> {target_currency}: {e}"
                         )
-                        values[target_currency] = Decimal("0")
+                        values[target_currency] = ZERO
 
             object.__setattr__(self, "_values", values)
 
@@ -104,17 +125,17 @@ class Money:
 
     def as_currency(self, target_currency: Currency) -> Decimal:
         """指定された通貨の金額を取得"""
-        return self._values.get(target_currency, Decimal("0"))
+        return self._values.get(target_currency, ZERO)
 
     @property
     def usd(self) -> Decimal:
         """USD金額を返す"""
-        return self._values.get(Currency.USD, Decimal("0"))
+        return self._values.get(Currency.USD, ZERO)
 
     @property
     def jpy(self) -> Decimal:
         """JPY金額を返す"""
-        return self._values.get(Currency.JPY, Decimal("0"))
+        return self._values.get(Currency.JPY, ZERO)
 
     def get_rate(self) -> Optional[float]:
         """USD/JPYレートを取得"""
@@ -129,18 +150,18 @@ class Money:
         new_values = {}
         for currency in self._values.keys():
             new_values[currency] = self._values.get(
-                currency, Decimal("0")
-            ) + other._values.get(currency, Decimal("0"))
-        return Money(Decimal("0"), self.currency, _values=new_values)
+                currency, ZERO
+            ) + other._values.get(currency, ZERO)
+        return Money(ZERO, self.currency, _values=new_values)
 
     def __sub__(self, other: "Money") -> "Money":
         """減算"""
         new_values = {}
         for currency in self._values.keys():
             new_values[currency] = self._values.get(
-                currency, Decimal("0")
-            ) - other._values.get(currency, Decimal("0"))
-        return Money(Decimal("0"), self.currency, _values=new_values)
+                currency, ZERO
+            ) - other._values.get(currency, ZERO)
+        return Money(ZERO, self.currency, _values=new_values)
 
     def __str__(self) -> str:
         """通貨と金額の文字列表現"""
@@ -158,12 +179,12 @@ class Money:
     def sum(cls, monies: list["Money"]) -> "Money":
         """Money配列の合計"""
         if not monies:
-            return Money(Decimal("0"), Currency.USD)
+            return Money(ZERO, Currency.USD)
 
         new_values = {}
         currencies = [Currency.USD, Currency.JPY]
         for currency in currencies:
             new_values[currency] = sum(
-                money._values.get(currency, Decimal("0")) for money in monies
+                money._values.get(currency, ZERO) for money in monies
             )
-        return Money(Decimal("0"), Currency.USD, _values=new_values)
+        return Money(ZERO, Currency.USD, _values=new_values)
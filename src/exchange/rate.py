@@ -1,10 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from typing import Dict, Optional
 from .currency import Currency
 
 
+# 小数点以下の桁数ごとの丸め単位（Decimal("1"), Decimal("0.01") など）
+_QUANTUMS: Dict[int, Decimal] = {}
+
+
+def _quantum_for(decimals: int) -> Decimal:
+    """
+    小数点以下の桁数に対応する丸め単位を取得
+
+    Args:
+        decimals: 小数点以下の桁数
+
+    Returns:
+        丸め単位のDecimal
+    """
+    quantum = _QUANTUMS.get(decimals)
+    if quantum is None:
+        quantum = Decimal(1).scaleb(-decimals)
+        _QUANTUMS[decimals] = quantum
+    return quantum
+
+
 @dataclass(frozen=True)
 class Rate:
     """
@@ -16,6 +37,7 @@ class Rate:
     value: Decimal
     rate_date: date
     source: str = "system"
+    _quantum: Decimal = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -26,6 +48,9 @@ class Rate:
 
         self._validate_rate()
 
+        # 変換先通貨の丸め単位は生成時に一度だけ決定
+        object.__setattr__(self, "_quantum", _quantum_for(self.target.decimals))
+
     def _validate_rate(self) -> None:
         """
         レートの検証
@@ -50,14 +75,10 @@ class Rate:
         converted = amount * self.value
 
         if round_decimals is not None:
-            return converted.quantize(
-                Decimal(f"0.{'0' * round_decimals}"), rounding=ROUND_HALF_UP
-            )
+            return converted.quantize(_quantum_for(round_decimals), ROUND_HALF_UP)
 
-        # 通貨に応じた丸め処理
-        if self.target == Currency.JPY:
-            return converted.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-        return converted.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        # 通貨に応じた丸め処理（roundingは位置引数で渡しキーワード解析を省く）
+        return converted.quantize(self._quantum, ROUND_HALF_UP)
 
     def inverse(self) -> "Rate":
         """
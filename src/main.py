@@ -83,6 +83,8 @@ class Config:
 
         return {
             "version": 1,
+            # モジュールレベルのロガーはdictConfig前に生成されるため無効化しない
+            "disable_existing_loggers": False,
             "formatters": {
                 "detailed": {"format": self.config["logging"]["log_format"]}
             },
@@ -8,6 +8,16 @@ from ..exchange.money import Money
 T = TypeVar("T")
 
 
+def _format_usd(amount: Decimal) -> str:
+    """USD金額を桁区切り・小数2桁で書式化"""
+    return f"${abs(amount):,.2f}"
+
+
+def _format_jpy(amount: Decimal) -> str:
+    """JPY金額を桁区切り・整数で書式化"""
+    return f"¥{int(abs(amount)):,}"
+
+
 @dataclass
 class ColorScheme:
     """色スキーマのデータクラス定義"""
@@ -71,6 +81,9 @@ class BaseFormatter(ABC, Generic[T]):
         """
         if isinstance(value, Money):
             amount = value.usd if currency == "USD" else value.jpy
+        elif isinstance(value, Decimal):
+            # CSVの金額列はDecimalで渡されるため文字列経由の再変換を省く
+            amount = value
         else:
             amount = Decimal(str(value))
 
@@ -92,11 +105,7 @@ class BaseFormatter(ABC, Generic[T]):
         Returns:
             フォーマットされた文字列
         """
-        if is_jpy:
-            return f"¥{int(abs(amount)):,}"
-
-        whole, decimal = f"{abs(amount):.2f}".split(".")
-        return f"${int(whole):,}.{decimal}"
+        return _format_jpy(amount) if is_jpy else _format_usd(amount)
 
     def _color(self, text: str, color: str) -> str:
         """
@@ -1,29 +1,73 @@
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence
 import csv
 import logging
 
 from .base import BaseOutput, BaseFormatter
 
 
+class _ReportDialect(csv.excel):
+    """全CSV出力で共有する書式（区切り・引用符・改行はexcel方言と同一）"""
+
+    quoting = csv.QUOTE_MINIMAL
+
+
 class CSVFormatter(BaseFormatter[List[Dict[str, Any]]]):
     """CSV出力用フォーマッター"""
 
-    def __init__(self, fieldnames: List[str], use_color: bool = False):
+    def __init__(self, fieldnames: Sequence[str], use_color: bool = False):
         super().__init__(use_color)
         self.fieldnames = fieldnames
+        # 列名ごとの通貨判定は固定のため、初期化時に一度だけ解決しておく
+        self._field_currencies = tuple(
+            (field, self._resolve_currency(field)) for field in fieldnames
+        )
+
+    @staticmethod
+    def _resolve_currency(field: str) -> Optional[str]:
+        """
+        列名から金額フォーマットの通貨を判定
+
+        Args:
+            field: 列名
 
-    def format(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        Returns:
+            通貨コード、金額列でない場合はNone
+        """
+        if field.endswith("_jpy"):
+            return "JPY"
+        if field.endswith(("amount", "price", "gain", "pnl", "fees")):
+            return "USD"
+        return None
+
+    def format(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """
         レコードのフォーマット
 
+        中間リストを作らず、書き出し側へ1行ずつ渡すイテレータを返します。
+
+        Args:
+            records: フォーマットするレコード
+
+        Returns:
+            フォーマットされたレコードのイテレータ
+        """
+        return (self._format_record(record) for record in records)
+
+    def format_rows(self, records: Iterable[Dict[str, Any]]) -> Iterator[List[str]]:
+        """
+        レコードを列順の値リストにフォーマット
+
+        csv.writerへ直接渡せる形式のため、DictWriterによる
+        行ごとの辞書→リスト変換と列名検査を省略できます。
+
         Args:
-            records: フォーマットするレコードリスト
+            records: フォーマットするレコード
 
         Returns:
-            フォーマットされたレコードリスト
+            fieldnamesの順に並んだ値リストのイテレータ
         """
-        return [self._format_record(record) for record in records]
+        return map(self._format_row, records)
 
     def _format_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -35,34 +79,48 @@ class CSVFormatter(BaseFormatter[List[Dict[str, Any]]]):
         Returns:
             フォーマットされたレコード
         """
-        formatted = {}
+        return dict(zip(self.fieldnames, self._format_row(record)))
 
-        for field in self.fieldnames:
+    def _format_row(self, record: Dict[str, Any]) -> List[str]:
+        """
+        個別レコードを列順の値リストにフォーマット
+
+        Args:
+            record: フォーマットするレコード
+
+        Returns:
+            fieldnamesの順に並んだフォーマット済みの値
+        """
+        row = []
+        append = row.append
+        format_money = self.format_money
+
+        for field, currency in self._field_currencies:
             value = record.get(field, "")
 
             if not value:
-                formatted[field] = ""
-                continue
-
-            if field.endswith("_jpy"):
-                formatted[field] = self.format_money(value, "JPY", use_color=False)
-            elif field.endswith(("amount", "price", "gain", "pnl", "fees")):
-                formatted[field] = self.format_money(value, "USD", use_color=False)
+                append("")
+            elif currency is None:
+                append(str(value))
             else:
-                formatted[field] = str(value)
+                append(format_money(value, currency, use_color=False))
 
-        return formatted
+        return row
 
 
 class CSVOutput(BaseOutput[List[Dict[str, Any]]]):
     """CSV出力クラス"""
 
+    # 書き込みバッファサイズ（行ごとの小さなwriteをまとめるため大きめに確保）
+    DEFAULT_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         output_path: Path,
-        fieldnames: List[str],
+        fieldnames: Sequence[str],
         encoding: str = "utf-8",
         use_color: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ):
         """
         CSV出力を初期化
@@ -72,31 +130,37 @@ class CSVOutput(BaseOutput[List[Dict[str, Any]]]):
             fieldnames: CSV列名リスト
             encoding: ファイルエンコーディング
             use_color: カラー出力フラグ
+            buffer_size: ファイル書き込みバッファのサイズ（バイト）
         """
         formatter = CSVFormatter(fieldnames, use_color)
         super().__init__(formatter)
         self.output_path = output_path
         self.fieldnames = fieldnames
         self.encoding = encoding
+        self.buffer_size = buffer_size
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def output(self, records: List[Dict[str, Any]]) -> None:
+    def output(self, records: Iterable[Dict[str, Any]]) -> None:
         """
         レコードをCSVファイルに出力
 
         Args:
-            records: 出力するレコードリスト
+            records: 出力するレコード（リストまたはイテレータ）
         """
         try:
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
-            formatted_records = self.format_data(records)
 
-            with self.output_path.open("w", newline="", encoding=self.encoding) as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writeheader()
-                writer.writerows(formatted_records)
+            # 変換エラーで途中までのファイルが残らないよう、全行を確定してから開く
+            rows = list(self.formatter.format_rows(records))
+
+            with self.output_path.open(
+                "w", newline="", encoding=self.encoding, buffering=self.buffer_size
+            ) as f:
+                writer = csv.writer(f, dialect=_ReportDialect)
+                writer.writerow(self.fieldnames)
+                writer.writerows(rows)
 
-            self.logger.info(f"{len(records)}件のレコードを{self.output_path}に出力")
+            self.logger.info(f"{len(rows)}件のレコードを{self.output_path}に出力")
 
         except Exception as e:
             self.logger.error(f"CSV出力エラー: {e}")
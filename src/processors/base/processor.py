@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional, Any, Dict
+from typing import Generic, TypeVar, List, Optional, Any, Dict, FrozenSet
 from datetime import date
 from decimal import Decimal
+from operator import attrgetter
 import logging
 import traceback
 
@@ -16,6 +17,11 @@ T = TypeVar("T")
 class BaseProcessor(ABC, Generic[T]):
     """基本処理クラス"""
 
+    # 税金として扱うアクション（判定のたびに集合を作らないようクラスで共有する）
+    _TAX_ACTIONS: FrozenSet[str] = frozenset(
+        {"NRA TAX ADJ", "PR YR NRA TAX", "TAX", "NRA TAX"}
+    )
+
     def __init__(self):
         self._trade_records: List[T] = []
         self._tax_records: Dict[str, List[Dict]] = {}
@@ -87,8 +93,7 @@ class BaseProcessor(ABC, Generic[T]):
 
     def _is_tax_transaction(self, transaction: Transaction) -> bool:
         """税金トランザクションの判定"""
-        tax_actions = {"NRA TAX ADJ", "PR YR NRA TAX", "TAX", "NRA TAX"}
-        is_tax = transaction.action_type.upper() in tax_actions
+        is_tax = transaction.action_type.upper() in self._TAX_ACTIONS
         self.logger.debug(f"税金取引判定: {transaction.action_type} -> {is_tax}")
         return is_tax
 
@@ -149,10 +154,7 @@ class BaseProcessor(ABC, Generic[T]):
 
     def get_records(self) -> List[T]:
         """トレードレコードの取得"""
-        return sorted(
-            self._trade_records,
-            key=lambda x: getattr(x, "record_date", getattr(x, "trade_date", None)),
-        )
+        return sorted(self._trade_records, key=attrgetter("record_date"))
 
     @abstractmethod
     def get_summary_records(self) -> List[Any]:
@@ -4,7 +4,7 @@ from decimal import Decimal
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseTradeRecord(ABC):
     """基本取引記録"""
 
@@ -1,16 +1,18 @@
-from typing import Set
+from typing import FrozenSet
 
 
 class DividendActionTypes:
-    VALID_ACTIONS: Set[str] = {
-        "DIVIDEND",
-        "CASH DIVIDEND",
-        "REINVEST DIVIDEND",
-        "REINVEST SHARES",
-        "PR YR CASH DIV",
-    }
+    VALID_ACTIONS: FrozenSet[str] = frozenset(
+        {
+            "DIVIDEND",
+            "CASH DIVIDEND",
+            "REINVEST DIVIDEND",
+            "REINVEST SHARES",
+            "PR YR CASH DIV",
+        }
+    )
 
-    TAX_ACTIONS: Set[str] = {"NRA TAX ADJ", "PR YR NRA TAX"}
+    TAX_ACTIONS: FrozenSet[str] = frozenset({"NRA TAX ADJ", "PR YR NRA TAX"})
 
 
 class DividendTypes:
@@ -6,12 +6,13 @@ from ...exchange.currency import Currency
 from ..base.record import BaseSummaryRecord, BaseTradeRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class DividendTradeRecord(BaseTradeRecord):
     action_type: str
     income_type: str
     gross_amount: Money
     tax_amount: Money
+    net_amount: Money = field(init=False, repr=False, compare=False)
 
     @property
     def gross_amount_jpy(self) -> Money:
@@ -21,9 +22,9 @@ class DividendTradeRecord(BaseTradeRecord):
     def tax_amount_jpy(self) -> Money:
         return self.tax_amount.as_currency(Currency.JPY)
 
-    @property
-    def net_amount(self) -> Money:
-        return self.gross_amount - self.tax_amount
+    def __post_init__(self) -> None:
+        # 取引記録は生成後に変更されないため、純額は生成時に一度だけ計算する
+        self.net_amount = self.gross_amount - self.tax_amount
 
     @property
     def net_amount_jpy(self) -> Money:
@@ -1,4 +1,4 @@
-from typing import Set, Dict
+from typing import Dict, FrozenSet
 from decimal import Decimal
 
 
@@ -6,15 +6,17 @@ class InterestProcessingConfig:
     """利子処理の設定と定数"""
 
     # 有効な利子アクション
-    INTEREST_ACTIONS: Set[str] = {
-        "CREDIT INTEREST",
-        "BANK INTEREST",
-        "BOND INTEREST",
-        "CD INTEREST",
-        "CD INTEREST TOTAL",
-        "CREDIT",
-        "PR YR BANK INT",
-    }
+    INTEREST_ACTIONS: FrozenSet[str] = frozenset(
+        {
+            "CREDIT INTEREST",
+            "BANK INTEREST",
+            "BOND INTEREST",
+            "CD INTEREST",
+            "CD INTEREST TOTAL",
+            "CREDIT",
+            "PR YR BANK INT",
+        }
+    )
 
     # 利子の種類を判定するマッピング
     INTEREST_TYPES: Dict[str, str] = {
@@ -6,7 +6,7 @@ from ...exchange.currency import Currency
 from ..base.record import BaseSummaryRecord, BaseTradeRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class InterestTradeRecord(BaseTradeRecord):
     """利子取引記録"""
 
@@ -15,6 +15,7 @@ class InterestTradeRecord(BaseTradeRecord):
 
     gross_amount: Money
     tax_amount: Money
+    net_amount: Money = field(init=False, repr=False, compare=False)
 
     @property
     def gross_amount_jpy(self) -> Money:
@@ -24,9 +25,9 @@ class InterestTradeRecord(BaseTradeRecord):
     def tax_amount_jpy(self) -> Money:
         return self.tax_amount.as_currency(Currency.JPY)
 
-    @property
-    def net_amount(self) -> Money:
-        return self.gross_amount - self.tax_amount
+    def __post_init__(self) -> None:
+        # 取引記録は生成後に変更されないため、純額は生成時に一度だけ計算する
+        self.net_amount = self.gross_amount - self.tax_amount
 
     @property
     def net_amount_jpy(self) -> Money:
@@ -1,4 +1,5 @@
-from typing import Set
+from typing import Dict, FrozenSet, Pattern
+import re
 
 
 class OptionProcessingConfig:
@@ -7,26 +8,22 @@ class OptionProcessingConfig:
     # 1契約あたりの株数
     SHARES_PER_CONTRACT = 100
 
-    # 有効なオプションアクション
-    OPTION_ACTIONS: Set[str] = {
-        "BUY_TO_OPEN",
-        "SELL_TO_OPEN",
-        "BUY_TO_CLOSE",
-        "SELL_TO_CLOSE",
-        "EXPIRED",
-        "ASSIGNED",
-    }
-
     # オプションシンボルのパターン
     OPTION_SYMBOL_PATTERN = r"\d{2}/\d{2}/\d{4}\s+\d+\.\d+\s+[CP]"
 
+    # コンパイル済みのオプションシンボルパターン（取引ごとの判定で再利用）
+    OPTION_SYMBOL_RE: Pattern[str] = re.compile(OPTION_SYMBOL_PATTERN, re.ASCII)
+
     # アクション種別
-    ACTION_TYPES = {
-        "OPEN": {"BUY_TO_OPEN", "SELL_TO_OPEN"},
-        "CLOSE": {"BUY_TO_CLOSE", "SELL_TO_CLOSE"},
-        "EXPIRE": {"EXPIRED"},
-        "ASSIGN": {"ASSIGNED"},
+    ACTION_TYPES: Dict[str, FrozenSet[str]] = {
+        "OPEN": frozenset({"BUY_TO_OPEN", "SELL_TO_OPEN"}),
+        "CLOSE": frozenset({"BUY_TO_CLOSE", "SELL_TO_CLOSE"}),
+        "EXPIRE": frozenset({"EXPIRED"}),
+        "ASSIGN": frozenset({"ASSIGNED"}),
     }
 
+    # 有効なオプションアクション（アクション種別の和集合を共有する）
+    OPTION_ACTIONS: FrozenSet[str] = frozenset().union(*ACTION_TYPES.values())
+
     # ポジションタイプ
     POSITION_TYPES = {"LONG": "Long", "SHORT": "Short"}
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 from datetime import date
 from typing import List, Dict
+from ...exchange.money import round_cent, ZERO
 from .config import OptionProcessingConfig
 
 
@@ -97,7 +98,7 @@ class OptionPosition:
 
         # 1契約あたりの手数料を計算
         fee_per_contract = close_fees / quantity
-        realized_gain = Decimal("0")
+        realized_gain = ZERO
         remaining_quantity = quantity
 
         while remaining_quantity > 0 and contracts:
@@ -145,15 +146,11 @@ class OptionPosition:
 
             remaining_quantity -= close_quantity
 
-        return {
-            "realized_gain": realized_gain.quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
-            )
-        }
+        return {"realized_gain": round_cent(realized_gain)}
 
     def handle_expiration(self, expire_date: date) -> Dict[str, Decimal]:
         """期限切れの処理"""
-        premium_pnl = Decimal("0")
+        premium_pnl = ZERO
 
         # ロングポジションの処理（支払ったプレミアムは損失）
         for contract in self.long_contracts:
@@ -177,9 +174,7 @@ class OptionPosition:
         self.long_contracts.clear()
         self.short_contracts.clear()
 
-        return {
-            "premium_pnl": premium_pnl.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        }
+        return {"premium_pnl": round_cent(premium_pnl)}
 
     def has_open_position(self) -> bool:
         """オープンポジションの有無を確認"""
@@ -210,4 +205,4 @@ class OptionPosition:
             # 売り建ての場合: (売値 - 買値) * 契約サイズ - 手数料
             pnl = (open_price - close_price) * contract_size - (open_fees + close_fees)
 
-        return pnl.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return round_cent(pnl)
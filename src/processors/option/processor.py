@@ -2,11 +2,12 @@ from typing import Dict, List, Optional
 from datetime import date, datetime
 from decimal import Decimal
 import re
+import sys
 import logging
 
 from ...core.tx import Transaction
 from ..base.processor import BaseProcessor
-from ...exchange.money import Money
+from ...exchange.money import Money, ZERO
 from ...exchange.currency import Currency
 
 from .record import OptionTradeRecord, OptionSummaryRecord
@@ -14,6 +15,14 @@ from .position import OptionPosition, OptionContract
 from .tracker import OptionTransactionTracker
 from .config import OptionProcessingConfig
 
+# オプションシンボル（原資産 満期日 権利行使価格 C/P）の解析パターン
+_OPTION_SYMBOL_PARTS = re.compile(
+    r"(\w+)\s+(\d{2}/\d{2}/\d{4})\s+(\d+\.\d+)\s+([CP])", re.ASCII
+)
+
+# 正規化済みアクション名のキャッシュ（元のアクション名 → 正規化名）
+_NORMALIZED_ACTIONS: Dict[str, str] = {}
+
 
 class OptionProcessor(BaseProcessor[OptionTradeRecord]):
     def __init__(self):
@@ -21,6 +30,14 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
         self._positions: Dict[str, OptionPosition] = {}
         self._summary_records: Dict[str, OptionSummaryRecord] = {}
         self._transaction_tracker = OptionTransactionTracker()
+        self._option_info_cache: Dict[str, Optional[Dict]] = {}
+        self._pnl_totals: Dict[str, Money] = {
+            "trading_pnl": Money(ZERO, Currency.USD),
+            "premium_pnl": Money(ZERO, Currency.USD),
+            "fees": Money(ZERO, Currency.USD),
+        }
+        # _pnl_totalsに加算済みのレコード数
+        self._pnl_record_count = 0
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _process_daily_transactions(
@@ -64,6 +81,7 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
         quantity = abs(Decimal(str(transaction.quantity or 0)))
         per_share_price = Decimal(str(transaction.price or 0))
         fees = Decimal(str(transaction.fees or 0))
+        transaction_date = transaction.transaction_date
 
         position = self._get_or_create_position(symbol)
         trading_result = self._handle_transaction_type(
@@ -72,27 +90,20 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
             quantity,
             per_share_price,
             fees,
-            transaction.transaction_date,
+            transaction_date,
         )
+        # 取引結果の損益はレコード生成と追跡の双方で使うため一度だけ取り出す
+        trading_pnl = trading_result.get("trading_pnl", 0)
+        premium_pnl = trading_result.get("premium_pnl", 0)
 
         # Money オブジェクトの作成
-        price_money = Money(
-            per_share_price * quantity, Currency.USD, transaction.transaction_date
-        )
-        fees_money = Money(fees, Currency.USD, transaction.transaction_date)
-        trading_pnl_money = Money(
-            trading_result.get("trading_pnl", 0),
-            Currency.USD,
-            transaction.transaction_date,
-        )
-        premium_pnl_money = Money(
-            trading_result.get("premium_pnl", 0),
-            Currency.USD,
-            transaction.transaction_date,
-        )
+        price_money = Money(per_share_price * quantity, Currency.USD, transaction_date)
+        fees_money = Money(fees, Currency.USD, transaction_date)
+        trading_pnl_money = Money(trading_pnl, Currency.USD, transaction_date)
+        premium_pnl_money = Money(premium_pnl, Currency.USD, transaction_date)
 
         trade_record = OptionTradeRecord(
-            record_date=transaction.transaction_date,
+            record_date=transaction_date,
             account_id=transaction.account_id,
             symbol=symbol,
             description=transaction.description,
@@ -115,15 +126,13 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
 
         self._trade_records.append(trade_record)
         self._update_summary_record(symbol, trade_record, option_info)
+        self._update_pnl_totals(trade_record)
 
         self._transaction_tracker.update_tracking(
             symbol,
             action,
             quantity,
-            {
-                "trading_pnl": trading_result.get("trading_pnl", 0),
-                "premium_pnl": trading_result.get("premium_pnl", 0),
-            },
+            {"trading_pnl": trading_pnl, "premium_pnl": premium_pnl},
         )
 
     def _get_or_create_position(self, symbol: str) -> OptionPosition:
@@ -142,9 +151,9 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
         trade_date: date,
     ) -> Dict:
         """取引タイプに応じた処理"""
-        total_price = Decimal("0")
-        trading_pnl = Decimal("0")
-        premium_pnl = Decimal("0")
+        total_price = ZERO
+        trading_pnl = ZERO
+        premium_pnl = ZERO
 
         if action in OptionProcessingConfig.ACTION_TYPES["OPEN"]:
             contract = OptionContract(
@@ -189,24 +198,44 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
 
     @staticmethod
     def _normalize_action(action: str) -> str:
-        """アクション名の正規化"""
-        return action.upper().replace(" TO ", "_TO_").replace(" ", "")
+        """
+        アクション名の正規化
+
+        アクション名の種類は少ないため、正規化結果を元の名前ごとにキャッシュします。
+        """
+        normalized = _NORMALIZED_ACTIONS.get(action)
+        if normalized is None:
+            normalized = sys.intern(
+                action.upper().replace(" TO ", "_TO_").replace(" ", "")
+            )
+            _NORMALIZED_ACTIONS[action] = normalized
+        return normalized
 
     @staticmethod
     def _is_option_transaction(transaction: Transaction) -> bool:
         """オプション取引の判定"""
         normalized_action = OptionProcessor._normalize_action(transaction.action_type)
         return normalized_action in OptionProcessingConfig.OPTION_ACTIONS and bool(
-            re.search(
-                OptionProcessingConfig.OPTION_SYMBOL_PATTERN, transaction.symbol or ""
-            )
+            OptionProcessingConfig.OPTION_SYMBOL_RE.search(transaction.symbol or "")
         )
 
     def _parse_option_info(self, symbol: str) -> Optional[Dict]:
-        """オプション情報のパース"""
+        """
+        オプション情報のパース
+
+        同一シンボルの取引は繰り返し現れるため、結果をシンボル単位でキャッシュします。
+        """
+        if symbol in self._option_info_cache:
+            return self._option_info_cache[symbol]
+
+        option_info = self._parse_option_symbol(symbol)
+        self._option_info_cache[symbol] = option_info
+        return option_info
+
+    def _parse_option_symbol(self, symbol: str) -> Optional[Dict]:
+        """オプションシンボル文字列の解析"""
         try:
-            pattern = r"(\w+)\s+(\d{2}/\d{2}/\d{4})\s+(\d+\.\d+)\s+([CP])"
-            match = re.match(pattern, symbol)
+            match = _OPTION_SYMBOL_PARTS.match(symbol)
             if match:
                 underlying, expiry, strike, option_type = match.groups()
                 return {
@@ -286,6 +315,34 @@ class OptionProcessor(BaseProcessor[OptionTradeRecord]):
             summary.status = "Closed"
             summary.close_date = trade_record.record_date
 
+    def _update_pnl_totals(self, trade_record: OptionTradeRecord) -> None:
+        """損益合計の更新"""
+        totals = self._pnl_totals
+        totals["trading_pnl"] += trade_record.trading_pnl
+        totals["premium_pnl"] += trade_record.premium_pnl
+        totals["fees"] += trade_record.fees
+        self._pnl_record_count += 1
+
+    def get_pnl_totals(
+        self, records: List[OptionTradeRecord]
+    ) -> Optional[Dict[str, Money]]:
+        """
+        取引損益、プレミアム収入、手数料の合計を取得
+
+        レコード追加時に更新した値を返すため、レコードの再走査は不要です。
+        一括処理が途中で中断した場合など、集計済みの合計が渡されたレコードと
+        一致しないときはNoneを返し、呼び出し側でレコードから再計算させます。
+
+        Args:
+            records: process_allが返したオプション取引レコード
+
+        Returns:
+            損益合計、またはNone（レコードと一致しない場合）
+        """
+        if len(records) != self._pnl_record_count:
+            return None
+        return dict(self._pnl_totals)
+
     def get_summary_records(self) -> List[OptionSummaryRecord]:
         """サマリーレコードの取得"""
         return sorted(
@@ -8,7 +8,7 @@ from ...exchange.currency import Currency
 from ..base.record import BaseSummaryRecord, BaseTradeRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionTradeRecord(BaseTradeRecord):
     """オプション取引記録"""
 
@@ -1,12 +1,12 @@
 from decimal import Decimal
-from typing import Set
+from typing import FrozenSet
 
 
 class StockProcessingConfig:
     """株式処理の設定と定数"""
 
     # 株式取引の有効なアクション
-    STOCK_ACTIONS: Set[str] = {"BUY", "SELL"}
+    STOCK_ACTIONS: FrozenSet[str] = frozenset({"BUY", "SELL"})
 
     # 売買の方向
     TRANSACTION_TYPES = {"BUY": "Buy", "SELL": "Sell"}
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 from typing import List
 
+from ...exchange.money import round_cent, ZERO
+
 
 @dataclass
 class StockLot:
@@ -36,10 +38,10 @@ class StockPosition:
     ) -> Decimal:
         """FIFOで株式を売却し、損益を計算"""
         if not self.lots:
-            return Decimal("0")
+            return ZERO
 
         remaining_quantity = quantity
-        realized_gain = Decimal("0")
+        realized_gain = ZERO
 
         while remaining_quantity > 0 and self.lots:
             lot = self.lots[0]
@@ -60,13 +62,18 @@ class StockPosition:
 
             remaining_quantity -= sell_quantity
 
-        return realized_gain.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return round_cent(realized_gain)
 
     @property
     def average_price(self) -> Decimal:
-        total_cost = sum(lot.quantity * lot.price for lot in self.lots)
-        total_quantity = sum(lot.quantity for lot in self.lots)
-        return total_cost / total_quantity if total_quantity > 0 else Decimal("0")
+        # 取得総額と総数量はロットを1回走査して同時に集計する
+        total_cost = ZERO
+        total_quantity = ZERO
+        for lot in self.lots:
+            quantity = lot.quantity
+            total_cost += quantity * lot.price
+            total_quantity += quantity
+        return total_cost / total_quantity if total_quantity > 0 else ZERO
 
     @property
     def total_quantity(self) -> Decimal:
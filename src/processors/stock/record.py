@@ -7,7 +7,7 @@ from ...exchange.money import Money
 from ...exchange.currency import Currency
 
 
-@dataclass
+@dataclass(slots=True)
 class StockTradeRecord:
     trade_date: date
     account_id: str
@@ -20,6 +20,11 @@ class StockTradeRecord:
     fees: Money
     exchange_rate: Decimal
 
+    @property
+    def record_date(self) -> date:
+        """他の取引レコードと共通の日付属性"""
+        return self.trade_date
+
     @property
     def price_jpy(self):
         return self.price.convert(Currency.JPY)
@@ -1,11 +1,13 @@
 from __future__ import annotations
-from typing import Dict, List, TypeVar, Generic, Iterator
-from decimal import Decimal
+from typing import Dict, List, TypeVar, Generic
+from operator import attrgetter
 import logging
 
-from ..exchange.money import Money
+from ..exchange.money import Money, ZERO
 from ..exchange.currency import Currency
 
+logger = logging.getLogger(__name__)
+
 R = TypeVar("R")  # レコードの型を表す汎用型
 
 
@@ -20,7 +22,6 @@ class ReportCalculator(Generic[R]):
         """
         ReportCalculatorのインスタンスを初期化
         """
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def calculate_income_summary(
         self, dividend_records: List[R], interest_records: List[R]
@@ -38,7 +39,7 @@ class ReportCalculator(Generic[R]):
         try:
             # レコードが空の場合のデフォルト値
             if not dividend_records and not interest_records:
-                zero_money = Money(Decimal("0"), Currency.USD)
+                zero_money = Money(ZERO, Currency.USD)
                 return {
                     "dividend_total": zero_money,
                     "interest_total": zero_money,
@@ -46,23 +47,14 @@ class ReportCalculator(Generic[R]):
                     "net_total": zero_money,
                 }
 
-            # 配当総額の計算
-            dividend_total = self._safe_sum(
-                (record.gross_amount for record in dividend_records),
-                Money(Decimal("0"), Currency.USD),
-            )
-
-            # 利子総額の計算
-            interest_total = self._safe_sum(
-                (record.gross_amount for record in interest_records),
-                Money(Decimal("0"), Currency.USD),
+            # 配当・利子それぞれ1回の走査で総額と税額を集計
+            dividend_total, dividend_tax = self._sum_fields(
+                dividend_records, "gross_amount", "tax_amount"
             )
-
-            # 税金総額の計算
-            tax_total = self._safe_sum(
-                (record.tax_amount for record in dividend_records + interest_records),
-                Money(Decimal("0"), Currency.USD),
+            interest_total, interest_tax = self._sum_fields(
+                interest_records, "gross_amount", "tax_amount"
             )
+            tax_total = dividend_tax + interest_tax
 
             return {
                 "dividend_total": dividend_total,
@@ -71,7 +63,7 @@ class ReportCalculator(Generic[R]):
                 "net_total": dividend_total + interest_total - tax_total,
             }
         except Exception as e:
-            self.logger.error(f"収入サマリー計算中にエラー: {e}", exc_info=True)
+            logger.error(f"収入サマリー計算中にエラー: {e}", exc_info=True)
             raise
 
     def calculate_stock_summary_details(self, records: List[R]) -> Money:
@@ -85,12 +77,10 @@ class ReportCalculator(Generic[R]):
             実現損益の合計
         """
         try:
-            return self._safe_sum(
-                (record.realized_gain for record in records),
-                Money(Decimal("0"), Currency.USD),
-            )
+            (realized_gain,) = self._sum_fields(records, "realized_gain")
+            return realized_gain
         except Exception as e:
-            self.logger.error(f"株式サマリー計算中にエラー: {e}", exc_info=True)
+            logger.error(f"株式サマリー計算中にエラー: {e}", exc_info=True)
             raise
 
     def calculate_option_summary_details(self, records: List[R]) -> Dict[str, Money]:
@@ -104,37 +94,62 @@ class ReportCalculator(Generic[R]):
             取引損益、プレミアム収入、手数料の集計
         """
         try:
+            trading_pnl, premium_pnl, fees = self._sum_fields(
+                records, "trading_pnl", "premium_pnl", "fees"
+            )
             return {
-                "trading_pnl": self._safe_sum(
-                    (record.trading_pnl for record in records),
-                    Money(Decimal("0"), Currency.USD),
-                ),
-                "premium_pnl": self._safe_sum(
-                    (record.premium_pnl for record in records),
-                    Money(Decimal("0"), Currency.USD),
-                ),
-                "fees": self._safe_sum(
-                    (record.fees for record in records),
-                    Money(Decimal("0"), Currency.USD),
-                ),
+                "trading_pnl": trading_pnl,
+                "premium_pnl": premium_pnl,
+                "fees": fees,
             }
         except Exception as e:
-            self.logger.error(f"オプションサマリー計算中にエラー: {e}", exc_info=True)
+            logger.error(f"オプションサマリー計算中にエラー: {e}", exc_info=True)
             raise
 
-    def _safe_sum(self, iterable: Iterator[Money], initial: Money) -> Money:
+    def _sum_fields(self, records: List[R], *fields: str) -> List[Money]:
         """
-        安全に合計を計算するヘルパーメソッド
+        複数のMoney属性を1回の走査で通貨別に合計するヘルパーメソッド
 
         Args:
-            iterable: Moneyオブジェクトの反復可能オブジェクト
-            initial: 初期値
+            records: 集計対象のレコードリスト
+            fields: 合計するMoney属性名
 
         Returns:
-            合計されたMoney
+            属性ごとに合計されたMoneyのリスト（fieldsと同じ順序）
         """
+        if not records:
+            # 空リストは走査も為替レート参照もせずにゼロを返す
+            zero_money = Money(
+                ZERO,
+                Currency.USD,
+                _values={Currency.USD: ZERO, Currency.JPY: ZERO},
+            )
+            return [zero_money] * len(fields)
+
         try:
-            return sum(iterable, initial)
-        except TypeError as e:
-            self.logger.error(f"合計計算中に型エラー: {e}", exc_info=True)
+            usd_totals = [ZERO] * len(fields)
+            jpy_totals = [ZERO] * len(fields)
+
+            # 属性の取り出しはC実装のattrgetterでレコードごとに一括で行い、
+            # 全ての属性を1回の走査で集計する
+            get_monies = attrgetter(*fields)
+            rows = map(get_monies, records)
+            if len(fields) == 1:
+                rows = ((money,) for money in rows)
+
+            for monies in rows:
+                for index, money in enumerate(monies):
+                    usd_totals[index] += money.usd
+                    jpy_totals[index] += money.jpy
+
+            return [
+                Money(
+                    ZERO,
+                    Currency.USD,
+                    _values={Currency.USD: usd, Currency.JPY: jpy},
+                )
+                for usd, jpy in zip(usd_totals, jpy_totals)
+            ]
+        except (TypeError, AttributeError) as e:
+            logger.error(f"合計計算中に型エラー: {e}", exc_info=True)
             raise ValueError("合計計算に失敗しました。要素の型を確認してください。")
@@ -0,0 +1,50 @@
+from typing import Any, Dict
+from decimal import Decimal
+
+from ..exchange.money import ZERO
+
+
+def safe_decimal(value: Any) -> Decimal:
+    """
+    値を安全にDecimalに変換
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        Decimal型の値、変換できない場合は0
+    """
+    if isinstance(value, Decimal):
+        # 既にDecimalであれば文字列経由の再生成は不要
+        return value
+    try:
+        return Decimal(str(value)) if value is not None else ZERO
+    except (TypeError, ValueError):
+        return ZERO
+
+
+def format_trade_fields(record: Any) -> Dict[str, Any]:
+    """
+    株式・オプション取引レコードに共通する列を変換
+
+    Args:
+        record: StockTradeRecordまたはOptionTradeRecord
+
+    Returns:
+        共通列のみを含むレポート形式の辞書
+    """
+    price = record.price
+    fees = record.fees
+    return {
+        "date": record.record_date,
+        "account": record.account_id,
+        "symbol": record.symbol,
+        "description": record.description,
+        "action": record.action,
+        "quantity": safe_decimal(record.quantity),
+        "price": safe_decimal(price.usd),
+        "fees": safe_decimal(fees.usd),
+        "price_jpy": safe_decimal(price.jpy),
+        "fees_jpy": safe_decimal(fees.jpy),
+        "exchange_rate": safe_decimal(record.exchange_rate),
+    }
@@ -1,11 +1,13 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Type, TypeVar
-from decimal import Decimal
 import logging
 
 from ..report.interfaces import BaseReportGenerator
+from ..report.common import safe_decimal
 from ..processors.interest.record import InterestTradeRecord
 
+logger = logging.getLogger(__name__)
+
 R = TypeVar("R", bound=InterestTradeRecord)
 
 
@@ -26,7 +28,6 @@ class InterestReportGenerator(BaseReportGenerator[Dict[str, Any]]):
         """
         super().__init__(writer)
         self.record_class = record_class
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def generate(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -58,11 +59,11 @@ class InterestReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             return [self._transform_record(record) for record in interest_records]
 
         except KeyError as e:
-            self.logger.error(f"必要なデータキーが見つかりません: {e}")
+            logger.error(f"必要なデータキーが見つかりません: {e}")
             raise ValueError(f"レポート生成に必要なデータが不足しています: {e}")
 
         except Exception as e:
-            self.logger.error(f"利子レポート生成中にエラー: {e}", exc_info=True)
+            logger.error(f"利子レポート生成中にエラー: {e}", exc_info=True)
             raise
 
     def _transform_record(self, record: R) -> Dict[str, Any]:
@@ -76,37 +77,26 @@ class InterestReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             レポート形式の辞書
         """
         try:
+            gross = record.gross_amount
+            tax = record.tax_amount
+            net = record.net_amount
             return {
                 "date": record.record_date,
                 "account": record.account_id,
                 "symbol": record.symbol or "",
                 "description": record.description,
-                "income_type": record.income_type,
                 "action_type": record.action_type,
-                "gross_amount": self._safe_decimal(record.gross_amount.usd),
-                "tax_amount": self._safe_decimal(record.tax_amount.usd),
-                "net_amount": self._safe_decimal(record.net_amount.usd),
-                "gross_amount_jpy": self._safe_decimal(record.gross_amount.jpy),
-                "tax_amount_jpy": self._safe_decimal(record.tax_amount.jpy),
-                "net_amount_jpy": self._safe_decimal(record.net_amount.jpy),
+                "income_type": record.income_type,
+                "gross_amount": self._safe_decimal(gross.usd),
+                "tax_amount": self._safe_decimal(tax.usd),
+                "net_amount": self._safe_decimal(net.usd),
+                "gross_amount_jpy": self._safe_decimal(gross.jpy),
+                "tax_amount_jpy": self._safe_decimal(tax.jpy),
+                "net_amount_jpy": self._safe_decimal(net.jpy),
                 "exchange_rate": self._safe_decimal(record.exchange_rate),
             }
         except AttributeError as e:
-            self.logger.error(f"レコード変換中に属性エラー: {e}")
+            logger.error(f"レコード変換中に属性エラー: {e}")
             raise TypeError(f"レコードの属性が不正です: {e}")
 
-    @staticmethod
-    def _safe_decimal(value: Any) -> Decimal:
-        """
-        値を安全にDecimalに変換
-
-        Args:
-            value: 変換する値
-
-        Returns:
-            Decimal型の値、変換できない場合は0
-        """
-        try:
-            return Decimal(str(value)) if value is not None else Decimal("0")
-        except (TypeError, ValueError):
-            return Decimal("0")
+    _safe_decimal = staticmethod(safe_decimal)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, TypeVar, Generic, Optional
+from typing import Dict, Any, Iterable, TypeVar, Generic
 import logging
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
@@ -22,7 +24,6 @@ class BaseReportGenerator(Generic[T], ABC):
             writer: レポートを書き出すライター
         """
         self.writer = writer
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     @contextmanager
     def _error_handling(self, operation: str):
@@ -35,18 +36,15 @@ class BaseReportGenerator(Generic[T], ABC):
         try:
             yield
         except Exception as e:
-            self.logger.error(f"{operation}中にエラーが発生: {e}", exc_info=True)
+            logger.error(f"{operation}中にエラーが発生: {e}", exc_info=True)
             raise
 
-    def generate_and_write(self, data: Dict[str, Any]) -> Optional[List[T]]:
+    def generate_and_write(self, data: Dict[str, Any]) -> None:
         """
         レポートの生成と書き出しを行う
 
         Args:
             data: レポート生成に必要なデータ
-
-        Returns:
-            生成されたレコードのリスト、エラー時はNone
         """
         with self._error_handling("レポート生成"):
             records = self.generate(data)
@@ -54,10 +52,8 @@ class BaseReportGenerator(Generic[T], ABC):
             with self._error_handling("レポート書き出し"):
                 self.writer.output(records)
 
-            return records
-
     @abstractmethod
-    def generate(self, data: Dict[str, Any]) -> List[T]:
+    def generate(self, data: Dict[str, Any]) -> Iterable[T]:
         """
         レポート生成の抽象メソッド
 
@@ -65,6 +61,6 @@ class BaseReportGenerator(Generic[T], ABC):
             data: レポート生成に必要なデータ
 
         Returns:
-            生成されたレコードのリスト
+            生成されたレコード（リストまたはイテレータ）
         """
         pass
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Type, TypeVar, Optional
-from decimal import Decimal
 import logging
 from datetime import date
 
 from ..report.interfaces import BaseReportGenerator
+from ..report.common import format_trade_fields, safe_decimal
 from ..processors.option.record import OptionTradeRecord
 
+logger = logging.getLogger(__name__)
+
 R = TypeVar("R", bound=OptionTradeRecord)
 
 
@@ -27,7 +29,6 @@ class OptionTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
         """
         super().__init__(writer)
         self.record_class = record_class
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def generate(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -59,11 +60,11 @@ class OptionTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             return [self._transform_record(record) for record in option_records]
 
         except KeyError as e:
-            self.logger.error(f"必要なデータキーが見つかりません: {e}")
+            logger.error(f"必要なデータキーが見つかりません: {e}")
             raise ValueError(f"レポート生成に必要なデータが不足しています: {e}")
 
         except Exception as e:
-            self.logger.error(f"オプションレポート生成中にエラー: {e}", exc_info=True)
+            logger.error(f"オプションレポート生成中にエラー: {e}", exc_info=True)
             raise
 
     def _transform_record(self, record: R) -> Dict[str, Any]:
@@ -77,50 +78,29 @@ class OptionTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             レポート形式の辞書
         """
         try:
-            return {
-                "date": record.record_date,
-                "account": record.account_id,
-                "symbol": record.symbol,
-                "description": record.description,
-                "action": record.action,
-                "quantity": self._safe_decimal(record.quantity),
-                "option_type": record.option_type,
-                "strike_price": self._safe_float(record.strike_price),
-                "expiry_date": self._format_date(record.expiry_date),
-                "underlying": record.underlying,
-                "price": self._safe_decimal(record.price.usd),
-                "fees": self._safe_decimal(record.fees.usd),
-                "trading_pnl": self._safe_decimal(record.trading_pnl.usd),
-                "premium_pnl": self._safe_decimal(record.premium_pnl.usd),
-                "price_jpy": self._safe_decimal(record.price.jpy),
-                "fees_jpy": self._safe_decimal(record.fees.jpy),
-                "trading_pnl_jpy": self._safe_decimal(record.trading_pnl.jpy),
-                "premium_pnl_jpy": self._safe_decimal(record.premium_pnl.jpy),
-                "exchange_rate": self._safe_decimal(record.exchange_rate),
-                "position_type": record.position_type,
-                "is_closed": record.is_closed,
-                "is_expired": record.is_expired,
-                "is_assigned": record.is_assigned,
-            }
+            formatted = format_trade_fields(record)
+            formatted.update(
+                {
+                    "option_type": record.option_type,
+                    "strike_price": self._safe_float(record.strike_price),
+                    "expiry_date": self._format_date(record.expiry_date),
+                    "underlying": record.underlying,
+                    "trading_pnl": self._safe_decimal(record.trading_pnl.usd),
+                    "premium_pnl": self._safe_decimal(record.premium_pnl.usd),
+                    "trading_pnl_jpy": self._safe_decimal(record.trading_pnl.jpy),
+                    "premium_pnl_jpy": self._safe_decimal(record.premium_pnl.jpy),
+                    "position_type": record.position_type,
+                    "is_closed": record.is_closed,
+                    "is_expired": record.is_expired,
+                    "is_assigned": record.is_assigned,
+                }
+            )
+            return formatted
         except AttributeError as e:
-            self.logger.error(f"レコード変換中に属性エラー: {e}")
+            logger.error(f"レコード変換中に属性エラー: {e}")
             raise TypeError(f"レコードの属性が不正です: {e}")
 
-    @staticmethod
-    def _safe_decimal(value: Any) -> Decimal:
-        """
-        値を安全にDecimalに変換
-
-        Args:
-            value: 変換する値
-
-        Returns:
-            Decimal型の値、変換できない場合は0
-        """
-        try:
-            return Decimal(str(value)) if value is not None else Decimal("0")
-        except (TypeError, ValueError):
-            return Decimal("0")
+    _safe_decimal = staticmethod(safe_decimal)
 
     @staticmethod
     def _safe_float(value: Any) -> float:
@@ -150,6 +130,7 @@ class OptionTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             'YYYY-MM-DD'形式の日付文字列、Noneの場合は空文字
         """
         try:
-            return value.strftime("%Y-%m-%d") if value is not None else ""
+            # dateの場合isoformatはstrftime("%Y-%m-%d")と同じ文字列をC実装で返す
+            return value.isoformat() if value is not None else ""
         except (AttributeError, TypeError):
             return ""
@@ -1,11 +1,13 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Type, TypeVar
-from decimal import Decimal
 import logging
 
 from ..report.interfaces import BaseReportGenerator
+from ..report.common import format_trade_fields, safe_decimal
 from ..processors.stock.record import StockTradeRecord
 
+logger = logging.getLogger(__name__)
+
 R = TypeVar("R", bound=StockTradeRecord)
 
 
@@ -26,7 +28,6 @@ class StockTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
         """
         super().__init__(writer)
         self.record_class = record_class
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def generate(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -58,11 +59,11 @@ class StockTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             return [self._transform_record(record) for record in stock_records]
 
         except KeyError as e:
-            self.logger.error(f"必要なデータキーが見つかりません: {e}")
+            logger.error(f"必要なデータキーが見つかりません: {e}")
             raise ValueError(f"レポート生成に必要なデータが不足しています: {e}")
 
         except Exception as e:
-            self.logger.error(f"株式取引レポート生成中にエラー: {e}", exc_info=True)
+            logger.error(f"株式取引レポート生成中にエラー: {e}", exc_info=True)
             raise
 
     def _transform_record(self, record: R) -> Dict[str, Any]:
@@ -76,37 +77,13 @@ class StockTradeReportGenerator(BaseReportGenerator[Dict[str, Any]]):
             レポート形式の辞書
         """
         try:
-            return {
-                "date": record.trade_date,
-                "account": record.account_id,
-                "symbol": record.symbol,
-                "description": record.description,
-                "action": record.action,
-                "quantity": self._safe_decimal(record.quantity),
-                "price": self._safe_decimal(record.price.usd),
-                "realized_gain": self._safe_decimal(record.realized_gain.usd),
-                "fees": self._safe_decimal(record.fees.usd),
-                "price_jpy": self._safe_decimal(record.price.jpy),
-                "realized_gain_jpy": self._safe_decimal(record.realized_gain.jpy),
-                "fees_jpy": self._safe_decimal(record.fees.jpy),
-                "exchange_rate": self._safe_decimal(record.exchange_rate),
-            }
+            formatted = format_trade_fields(record)
+            realized_gain = record.realized_gain
+            formatted["realized_gain"] = self._safe_decimal(realized_gain.usd)
+            formatted["realized_gain_jpy"] = self._safe_decimal(realized_gain.jpy)
+            return formatted
         except AttributeError as e:
-            self.logger.error(f"レコード変換中に属性エラー: {e}")
+            logger.error(f"レコード変換中に属性エラー: {e}")
             raise TypeError(f"レコードの属性が不正です: {e}")
 
-    @staticmethod
-    def _safe_decimal(value: Any) -> Decimal:
-        """
-        値を安全にDecimalに変換
-
-        Args:
-            value: 変換する値
-
-        Returns:
-            Decimal型の値、変換できない場合は0
-        """
-        try:
-            return Decimal(str(value)) if value is not None else Decimal("0")
-        except (TypeError, ValueError):
-            return Decimal("0")
+    _safe_decimal = staticmethod(safe_decimal)
@@ -1,15 +1,48 @@
-from typing import Dict, Any, List
-from decimal import Decimal
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from ..report.interfaces import BaseReportGenerator
 from ..report.calculators import ReportCalculator
-from ..exchange.money import Money
+from ..exchange.money import Money, ZERO
 from ..exchange.currency import Currency
 from ..processors.option.record import OptionSummaryRecord
 
 
+def _summary_row(
+    category: str,
+    subcategory: str,
+    gross: Money,
+    tax: Optional[Money] = None,
+    net: Optional[Money] = None,
+) -> Dict[str, Any]:
+    """
+    最終サマリーの1行を生成
+
+    Args:
+        category: 区分
+        subcategory: 小区分
+        gross: 総額
+        tax: 税額（省略時は0）
+        net: 純額（省略時は総額と同じ）
+
+    Returns:
+        最終サマリーCSVの1行分の辞書
+    """
+    if net is None:
+        net = gross
+    return {
+        "category": category,
+        "subcategory": subcategory,
+        "gross_amount_usd": gross.usd,
+        "tax_amount_usd": tax.usd if tax is not None else ZERO,
+        "net_amount_usd": net.usd,
+        "gross_amount_jpy": gross.jpy,
+        "tax_amount_jpy": tax.jpy if tax is not None else ZERO,
+        "net_amount_jpy": net.jpy,
+    }
+
+
 class OptionSummaryReportGenerator(BaseReportGenerator):
-    def generate(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def generate(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         option_processor = data.get("option_processor")
 
         if option_processor:
@@ -19,7 +52,7 @@ class OptionSummaryReportGenerator(BaseReportGenerator):
         else:
             option_summary_records = data.get("option_summary_records", [])
 
-        return [
+        return (
             {
                 "account": record.account_id,
                 "symbol": record.symbol,
@@ -27,9 +60,9 @@ class OptionSummaryReportGenerator(BaseReportGenerator):
                 "underlying": record.underlying,
                 "option_type": record.option_type,
                 "strike_price": float(record.strike_price),
-                "expiry_date": record.expiry_date.strftime("%Y-%m-%d"),
-                "open_date": record.open_date.strftime("%Y-%m-%d"),
-                "close_date": record.close_date.strftime("%Y-%m-%d")
+                "expiry_date": record.expiry_date.isoformat(),
+                "open_date": record.open_date.isoformat(),
+                "close_date": record.close_date.isoformat()
                 if record.close_date
                 else "",
                 "status": record.status,
@@ -43,122 +76,71 @@ class OptionSummaryReportGenerator(BaseReportGenerator):
                 "total_fees_jpy": record.total_fees.jpy,
             }
             for record in option_summary_records
-        ]
+        )
 
 
 class FinalSummaryReportGenerator(BaseReportGenerator):
     def generate(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        calculator = ReportCalculator()
-
-        # 収入サマリーの計算
-        dividend_records = data.get("dividend_records", [])
-        interest_records = data.get("interest_records", [])
-
-        # 株式とオプションの取引サマリーの計算
-        stock_records = data.get("stock_records", [])
-        option_records = data.get("option_records", [])
-
-        # 収入サマリー
-        income_summary = calculator.calculate_income_summary(
-            dividend_records, interest_records
+        # InvestmentReporterが事前計算した集計値があれば再利用する
+        if "income_summary" in data:
+            income_summary = data["income_summary"]
+            stock_summary = data["stock_summary"]
+            option_summary = data["option_pnl_totals"]
+        else:
+            income_summary, stock_summary, option_summary = self._calculate(data)
+
+        # 税額・純額は各通貨で共通に使うため、Moneyの減算は一度だけ行う
+        dividend_total = income_summary["dividend_total"]
+        dividend_tax = income_summary.get("dividend_tax", income_summary["tax_total"])
+        dividend_net = dividend_total - dividend_tax
+
+        interest_total = income_summary["interest_total"]
+        interest_tax = income_summary.get("interest_tax", Money(0, Currency.USD))
+        interest_net = interest_total - interest_tax
+
+        # (区分, 小区分, 総額, 税額, 純額) の表から各行を生成する
+        rows = (
+            ("配当収入", "受取配当金", dividend_total, dividend_tax, dividend_net),
+            ("利子収入", "受取利子", interest_total, interest_tax, interest_net),
+            ("株式取引", "売買損益", stock_summary, None, None),
+            ("オプション取引", "取引損益", option_summary["trading_pnl"], None, None),
+            ("オプション取引", "プレミアム収入", option_summary["premium_pnl"], None, None),
         )
+        return [_summary_row(*row) for row in rows]
 
-        # 株式取引のサマリー
-        stock_summary = calculator.calculate_stock_summary_details(stock_records)
-
-        # オプション取引のサマリー
-        option_summary = calculator.calculate_option_summary_details(option_records)
+    def _calculate(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Money], Money, Dict[str, Money]]:
+        """
+        最終サマリーに必要な集計値を計算
 
-        summary_records = []
+        Args:
+            data: レポート生成に必要なデータ
 
-        # 配当収入のサマリー
-        summary_records.append(
-            {
-                "category": "配当収入",
-                "subcategory": "受取配当金",
-                "gross_amount_usd": income_summary["dividend_total"].usd,
-                "tax_amount_usd": income_summary.get(
-                    "dividend_tax", income_summary["tax_total"]
-                ).usd,
-                "net_amount_usd": (
-                    income_summary["dividend_total"]
-                    - income_summary.get("dividend_tax", income_summary["tax_total"])
-                ).usd,
-                "gross_amount_jpy": income_summary["dividend_total"].jpy,
-                "tax_amount_jpy": income_summary.get(
-                    "dividend_tax", income_summary["tax_total"]
-                ).jpy,
-                "net_amount_jpy": (
-                    income_summary["dividend_total"]
-                    - income_summary.get("dividend_tax", income_summary["tax_total"])
-                ).jpy,
-            }
-        )
+        Returns:
+            (収入サマリー, 株式損益, オプション損益合計) のタプル
+        """
+        calculator = ReportCalculator()
 
-        # 利子収入のサマリー
-        summary_records.append(
-            {
-                "category": "利子収入",
-                "subcategory": "受取利子",
-                "gross_amount_usd": income_summary["interest_total"].usd,
-                "tax_amount_usd": income_summary.get(
-                    "interest_tax", Money(0, Currency.USD)
-                ).usd,
-                "net_amount_usd": (
-                    income_summary["interest_total"]
-                    - income_summary.get("interest_tax", Money(0, Currency.USD))
-                ).usd,
-                "gross_amount_jpy": income_summary["interest_total"].jpy,
-                "tax_amount_jpy": income_summary.get(
-                    "interest_tax", Money(0, Currency.USD)
-                ).jpy,
-                "net_amount_jpy": (
-                    income_summary["interest_total"]
-                    - income_summary.get("interest_tax", Money(0, Currency.USD))
-                ).jpy,
-            }
+        # 収入サマリー
+        income_summary = calculator.calculate_income_summary(
+            data.get("dividend_records", []), data.get("interest_records", [])
         )
 
         # 株式取引のサマリー
-        summary_records.append(
-            {
-                "category": "株式取引",
-                "subcategory": "売買損益",
-                "gross_amount_usd": stock_summary.usd,
-                "tax_amount_usd": Decimal("0"),
-                "net_amount_usd": stock_summary.usd,
-                "gross_amount_jpy": stock_summary.jpy,
-                "tax_amount_jpy": Decimal("0"),
-                "net_amount_jpy": stock_summary.jpy,
-            }
+        stock_summary = calculator.calculate_stock_summary_details(
+            data.get("stock_records", [])
         )
 
-        # オプション取引損益のサマリー
-        summary_records.append(
-            {
-                "category": "オプション取引",
-                "subcategory": "取引損益",
-                "gross_amount_usd": option_summary["trading_pnl"].usd,
-                "tax_amount_usd": Decimal("0"),
-                "net_amount_usd": option_summary["trading_pnl"].usd,
-                "gross_amount_jpy": option_summary["trading_pnl"].jpy,
-                "tax_amount_jpy": Decimal("0"),
-                "net_amount_jpy": option_summary["trading_pnl"].jpy,
-            }
-        )
-
-        # オプションプレミアム収入のサマリー
-        summary_records.append(
-            {
-                "category": "オプション取引",
-                "subcategory": "プレミアム収入",
-                "gross_amount_usd": option_summary["premium_pnl"].usd,
-                "tax_amount_usd": Decimal("0"),
-                "net_amount_usd": option_summary["premium_pnl"].usd,
-                "gross_amount_jpy": option_summary["premium_pnl"].jpy,
-                "tax_amount_jpy": Decimal("0"),
-                "net_amount_jpy": option_summary["premium_pnl"].jpy,
-            }
+        # オプション損益はプロセッサが集計済みの合計を、レコードと一致する場合のみ利用
+        option_records = data.get("option_records", [])
+        option_processor = data.get("option_processor")
+        option_summary = (
+            option_processor.get_pnl_totals(option_records)
+            if option_processor
+            else None
         )
+        if option_summary is None:
+            option_summary = calculator.calculate_option_summary_details(option_records)
 
-        return summary_records
+        return income_summary, stock_summary, option_summary